@@ -1,10 +1,12 @@
 __version__ = "1.0.0"
 
-from app.main import app, GlossaryDatabase, GlossaryTerm, GlossaryTermCreate
+from app.main import app, get_db, GlossaryDatabase, GlossaryTerm, GlossaryTermCreate, TermRow
 
 __all__ = [
     "app",
+    "get_db",
     "GlossaryDatabase",
     "GlossaryTerm",
     "GlossaryTermCreate",
+    "TermRow",
 ]
@@ -1,11 +1,22 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Path as PathParam
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-import json
+import asyncio
+import bisect
+from collections import Counter
+from dataclasses import asdict, dataclass, field, fields
+import itertools
+import logging
+import mmap
+import os
+import re
+import time
+import orjson
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ==================== Pydantic Models ====================
 
@@ -36,8 +47,7 @@ class GlossaryTerm(GlossaryTermBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GlossaryResponse(BaseModel):
@@ -46,94 +56,399 @@ class GlossaryResponse(BaseModel):
     data: Optional[dict | list] = None
 
 
+# ==================== Storage ====================
+
+@dataclass(slots=True, kw_only=True)
+class TermRow:
+    """Термин во внутреннем хранилище"""
+    id: int
+    title: str
+    definition: str
+    category: str = "General"
+    examples: list[str] = field(default_factory=list)
+    related_terms: list[str] = field(default_factory=list)
+    source: str = ""
+    created_at: str
+    updated_at: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TermRow":
+        """Собрать термин из записи снимка или журнала, лишние ключи отбрасываются"""
+        missing = TERM_REQUIRED_FIELDS - data.keys()
+        if missing:
+            raise ValueError(
+                f"Термин {data.get('id', '?')}: нет обязательных полей {', '.join(sorted(missing))}"
+            )
+        return cls(**{key: value for key, value in data.items() if key in TERM_FIELDS})
+
+
+TERM_FIELDS = frozenset(f.name for f in fields(TermRow))
+TERM_REQUIRED_FIELDS = frozenset({"id", "title", "definition", "created_at", "updated_at"})
+
+
 DATA_FILE = Path(__file__).parent / "glossary_data.json"
 
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+INDEXED_FIELDS = ("title", "definition", "category")
+FIELD_SEPARATOR = "\x1f"
+VOCAB_SEPARATOR = "\x00"
+FLUSH_DELAY = 0.1
+WAL_COMPACT_THRESHOLD = 1000
+WAL_FSYNC = False
+
+logger = logging.getLogger(__name__)
+
+
+def tokenize(text: str) -> set[str]:
+    """Разбить текст на множество токенов в нижнем регистре"""
+    return {token.casefold() for token in TOKEN_RE.findall(text or "")}
+
 
 class GlossaryDatabase:
-    def __init__(self, filepath: Path = DATA_FILE):
+    def __init__(self, filepath: Optional[Path] = DATA_FILE, data: Optional[dict] = None):
+        """filepath=None создает базу в памяти без чтения и записи файлов"""
         self.filepath = filepath
-        self.data = self._load_data()
+        glossary = (data if data is not None else self._load_data())["glossary"]
+        if filepath is not None:
+            self._wal_path = filepath.with_suffix(".jsonl")
+            glossary, self._wal_lines = self._replay_wal(glossary)
+            self._wal = open(self._wal_path, "ab")
+        else:
+            self._wal_path = None
+            self._wal_lines = 0
+            self._wal = None
+        # Термины хранятся в словаре по ID в порядке добавления: удаление - O(1)
+        self._by_id: dict[int, TermRow] = {}
+        for entry in glossary:
+            term = TermRow.from_dict(entry)
+            self._by_id[term.id] = term
+        # Строки поиска по ID: полные проходы читают только их, а не весь термин
+        self._blobs: dict[int, str] = {
+            term_id: self._make_blob(term) for term_id, term in self._by_id.items()
+        }
         self.next_id = self._get_next_id()
+        self._index: dict[str, set[int]] = {}
+        self._vocab: list[str] = []
+        self._vocab_text = ""
+        self._vocab_starts: list[int] = []
+        self._vocab_stale = True
+        self._category_counts: Counter[str] = Counter(
+            term.category for term in self._by_id.values()
+        )
+        for term in self._by_id.values():
+            self._index_term(term)
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
 
     def _load_data(self) -> dict:
         """Загрузить данные из JSON файла"""
-        if self.filepath.exists():
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        if self.filepath is not None and self.filepath.exists():
+            if not self.filepath.stat().st_size:
+                # Пустой снимок - след сбоя, а не пустой глоссарий
+                raise ValueError(f"Файл данных {self.filepath} пуст")
+            with open(self.filepath, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
         return {"glossary": []}
 
+    def _replay_wal(self, glossary: list[dict]) -> tuple[list[dict], int]:
+        """Применить к снимку операции из журнала, вернуть термины и число записей"""
+        if not self._wal_path.exists():
+            return glossary, 0
+
+        terms = {term["id"]: term for term in glossary}
+        count = 0
+        good_offset = 0
+        with open(self._wal_path, "rb") as f:
+            lines = f.readlines()
+        for line_number, line in enumerate(lines, 1):
+            if not line.endswith(b"\n"):
+                # Оборванная последняя запись после аварийного завершения
+                break
+            good_offset += len(line)
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning("Пропущена поврежденная строка %d журнала %s", line_number, self._wal_path)
+                continue
+            if entry["op"] == "delete":
+                terms.pop(entry["id"], None)
+            else:
+                terms[entry["term"]["id"]] = entry["term"]
+            count += 1
+
+        if good_offset < self._wal_path.stat().st_size:
+            # Иначе следующая запись приклеится к оборванной строке
+            logger.warning("Журнал %s обрезан до %d байт", self._wal_path, good_offset)
+            os.truncate(self._wal_path, good_offset)
+
+        return list(terms.values()), count
+
     def _save_data(self):
         """Сохранить данные в JSON файл"""
-        with open(self.filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        if self.filepath is None:
+            return
+        # Снимок пишется во временный файл и атомарно подменяет старый,
+        # чтобы сбой посреди записи не оставил поврежденный JSON
+        tmp_path = self.filepath.with_name(self.filepath.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            data = {"glossary": list(self._by_id.values())}
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.filepath)
+
+    def _log(self, op: str, **payload):
+        """Дописать операцию в журнал изменений"""
+        if self._wal is None:
+            return
+        self._wal.write(orjson.dumps({"op": op, **payload}) + b"\n")
+        self._wal_lines += 1
+
+    def compact(self):
+        """Переписать снимок и очистить журнал"""
+        if self._wal is None:
+            return
+        # Журнал очищается только после того, как новый снимок надежно на диске
+        self._save_data()
+        self._wal.truncate(0)
+        self._wal_lines = 0
+
+    def close(self):
+        """Сохранить все изменения и закрыть журнал"""
+        self.flush()
+        if self._wal is None:
+            return
+        self.compact()
+        self._wal.close()
+
+    def _mark_dirty(self):
+        """Отметить данные как измененные и отложить запись на диск"""
+        if self._wal is None:
+            return
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = loop.call_later(FLUSH_DELAY, self.flush)
+
+    def flush(self):
+        """Записать накопленные изменения на диск"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._dirty and self._wal is not None:
+            self._wal.flush()
+            if WAL_FSYNC:
+                os.fsync(self._wal.fileno())
+            if self._wal_lines >= WAL_COMPACT_THRESHOLD:
+                self.compact()
+        self._dirty = False
 
     def _get_next_id(self) -> int:
         """Получить следующий ID"""
-        if not self.data["glossary"]:
-            return 1
-        return max(term["id"] for term in self.data["glossary"]) + 1
+        return max(self._by_id, default=0) + 1
+
+    def _set_row(self, term: TermRow):
+        """Записать строку поиска и счетчик категории для нового или измененного термина"""
+        self._blobs[term.id] = self._make_blob(term)
+        self._category_counts[term.category] += 1
+
+    def _remove_row(self, term: TermRow):
+        """Удалить строку поиска термина и уменьшить счетчик его категории"""
+        del self._blobs[term.id]
+        self._discount_category(term.category)
+
+    def _discount_category(self, category: str):
+        self._category_counts[category] -= 1
+        if not self._category_counts[category]:
+            del self._category_counts[category]
+
+    def _make_blob(self, term: TermRow) -> str:
+        """Склеить искомые поля термина в одну строку в нижнем регистре"""
+        return FIELD_SEPARATOR.join(
+            getattr(term, field) or "" for field in INDEXED_FIELDS
+        ).casefold()
+
+    def _term_tokens(self, term: TermRow) -> set[str]:
+        tokens = set()
+        for field in INDEXED_FIELDS:
+            tokens |= tokenize(getattr(term, field))
+        return tokens
+
+    def _index_term(self, term: TermRow):
+        """Добавить термин в инвертированный индекс"""
+        for token in self._term_tokens(term):
+            postings = self._index.get(token)
+            if postings is None:
+                postings = self._index[token] = set()
+                self._vocab_stale = True
+            postings.add(term.id)
+
+    def _unindex_term(self, term: TermRow):
+        """Удалить термин из инвертированного индекса"""
+        for token in self._term_tokens(term):
+            postings = self._index.get(token)
+            if postings is None:
+                continue
+            postings.discard(term.id)
+            if not postings:
+                del self._index[token]
+                self._vocab_stale = True
+
+    def _build_vocab(self):
+        """Склеить словарь индекса в одну строку для поиска токенов запроса"""
+        self._vocab = list(self._index)
+        self._vocab_starts = []
+        offset = 0
+        for word in self._vocab:
+            self._vocab_starts.append(offset)
+            offset += len(word) + len(VOCAB_SEPARATOR)
+        self._vocab_text = VOCAB_SEPARATOR.join(self._vocab)
+        self._vocab_stale = False
+
+    def _matching_words(self, tokens: list[str]) -> list[set[int]]:
+        """Для каждого токена запроса найти номера слов словаря, содержащих его"""
+        if self._vocab_stale:
+            self._build_vocab()
+
+        words = [set() for _ in tokens]
+        text = self._vocab_text
+        for i, token in enumerate(tokens):
+            pos = text.find(token)
+            while pos != -1:
+                word = bisect.bisect_right(self._vocab_starts, pos) - 1
+                words[i].add(word)
+                # Остаток этого слова уже не даст новых совпадений
+                pos = text.find(token, self._vocab_starts[word] + len(self._vocab[word]))
+        return words
+
+    def _candidates(self, tokens: list[str]) -> list[set[int]]:
+        """ID терминов, содержащих каждый токен запроса как подстроку одного из своих токенов"""
+        candidates = []
+        for words in self._matching_words(tokens):
+            ids = set()
+            for word in words:
+                ids |= self._index[self._vocab[word]]
+            candidates.append(ids)
+        return candidates
+
+    def _match(self, candidates, keyword: str) -> list[int]:
+        """Оставить из candidates ID терминов, строка поиска которых содержит keyword"""
+        return [term_id for term_id in candidates if keyword in self._blobs[term_id]]
+
+    def get_statistics(self) -> dict:
+        """Получить статистику по категориям"""
+        return {
+            "total_terms": len(self._by_id),
+            "categories": dict(self._category_counts),
+            "categories_count": len(self._category_counts)
+        }
 
     def get_all(self) -> list:
         """Получить все термины"""
-        return self.data["glossary"]
+        return list(self._by_id.values())
+
+    def count(self) -> int:
+        """Получить количество терминов"""
+        return len(self._by_id)
+
+    def iter_page(self, skip: int, limit: int) -> list:
+        """Получить страницу терминов"""
+        return list(itertools.islice(self._by_id.values(), skip, skip + limit))
 
-    def get_by_id(self, term_id: int) -> Optional[dict]:
+    def get_by_id(self, term_id: int) -> Optional[TermRow]:
         """Получить термин по ID"""
-        for term in self.data["glossary"]:
-            if term["id"] == term_id:
-                return term
-        return None
+        return self._by_id.get(term_id)
 
     def search(self, keyword: str) -> list:
         """Поиск по ключевому слову"""
-        keyword_lower = keyword.lower()
-        results = []
-        for term in self.data["glossary"]:
-            if (keyword_lower in term["title"].lower() or
-                keyword_lower in term["definition"].lower() or
-                (term.get("category") and keyword_lower in term["category"].lower())):
-                results.append(term)
-        return results
-
-    def create(self, term_data: GlossaryTermCreate) -> dict:
-        """Создать новый термин"""
-        new_term = {
-            "id": self.next_id,
-            "title": term_data.title,
-            "definition": term_data.definition,
-            "category": term_data.category,
-            "examples": term_data.examples or [],
-            "related_terms": term_data.related_terms or [],
-            "source": term_data.source or "",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
-        self.data["glossary"].append(new_term)
+        keyword_folded = keyword.casefold()
+        if FIELD_SEPARATOR in keyword_folded:
+            return []
+        tokens = list(tokenize(keyword_folded))
+        if not tokens:
+            return [self._by_id[term_id] for term_id in self._match(self._blobs, keyword_folded)]
+
+        postings = sorted(self._candidates(tokens), key=len)
+        ids = postings[0]
+        for other in postings[1:]:
+            if not ids:
+                break
+            ids = ids & other
+
+        return [self._by_id[term_id] for term_id in self._match(sorted(ids), keyword_folded)]
+
+    def _insert(self, term_data: GlossaryTermCreate, now: str) -> TermRow:
+        new_term = TermRow(
+            id=self.next_id,
+            title=term_data.title,
+            definition=term_data.definition,
+            category=term_data.category,
+            examples=term_data.examples or [],
+            related_terms=term_data.related_terms or [],
+            source=term_data.source or "",
+            created_at=now,
+            updated_at=now
+        )
+        self._by_id[new_term.id] = new_term
+        self._set_row(new_term)
+        self._index_term(new_term)
         self.next_id += 1
-        self._save_data()
         return new_term
 
-    def update(self, term_id: int, term_data: GlossaryTermUpdate) -> Optional[dict]:
+    def create(self, term_data: GlossaryTermCreate) -> TermRow:
+        """Создать новый термин"""
+        new_term = self._insert(term_data, datetime.now().isoformat(timespec="seconds"))
+        self._log("create", term=new_term)
+        self._mark_dirty()
+        return new_term
+
+    def write_batch(self, creates: list[GlossaryTermCreate]) -> list[TermRow]:
+        """Создать несколько терминов с одной записью на диск"""
+        now = datetime.now().isoformat(timespec="seconds")
+        new_terms = [self._insert(term_data, now) for term_data in creates]
+        for new_term in new_terms:
+            self._log("create", term=new_term)
+        self._dirty = True
+        self.flush()
+        return new_terms
+
+    def update(self, term_id: int, term_data: GlossaryTermUpdate) -> Optional[TermRow]:
         term = self.get_by_id(term_id)
         if not term:
             return None
 
-        update_data = term_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
+        self._unindex_term(term)
+        old_category = term.category
+        for key in term_data.__pydantic_fields_set__:
+            value = getattr(term_data, key)
             if value is not None:
-                term[key] = value
-
-        term["updated_at"] = datetime.now().isoformat()
-        self._save_data()
+                setattr(term, key, value)
+        self._index_term(term)
+        self._discount_category(old_category)
+        self._set_row(term)
+
+        term.updated_at = datetime.now().isoformat(timespec="seconds")
+        self._log("update", term=term)
+        self._mark_dirty()
         return term
 
     def delete(self, term_id: int) -> bool:
-        for i, term in enumerate(self.data["glossary"]):
-            if term["id"] == term_id:
-                self.data["glossary"].pop(i)
-                self._save_data()
-                return True
-        return False
+        term = self._by_id.pop(term_id, None)
+        if term is None:
+            return False
+
+        self._remove_row(term)
+        self._unindex_term(term)
+        self._log("delete", id=term_id)
+        self._mark_dirty()
+        return True
 
 
 db = None
@@ -144,21 +459,47 @@ async def lifespan(app: FastAPI):
     global db
     db = GlossaryDatabase()
     yield
+    db.close()
+
+
+def get_db() -> GlossaryDatabase:
+    return db
 
 
 app = FastAPI(
     title="Glossary API - Децентрализованные Приложения",
     description="API для управления глоссарием терминов по разработке DApps",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+@app.exception_handler(HTTPException)
+async def http_exception_handler(request, exc: HTTPException):
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"success": False, "message": exc.detail, "data": None},
+        headers=exc.headers
+    )
+
+
+class SameOriginCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware, который не обрабатывает запросы без заголовка Origin"""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not any(name == b"origin" for name, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 app.add_middleware(
-    CORSMiddleware,
+    SameOriginCORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 
@@ -174,30 +515,47 @@ async def root():
     }
 
 
-@app.get("/health", tags=["Health"])
-async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
-
+# Секунда и отформатированная метка для /health
+_last_ts = (-1, "")
 
-@app.get("/api/glossary", response_model=GlossaryResponse, tags=["Glossary"])
-async def get_all_terms(skip: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=1000)):
-    all_terms = db.get_all()
-    paginated_terms = all_terms[skip:skip + limit]
 
-    return GlossaryResponse(
-        success=True,
-        message=f"Получено {len(paginated_terms)} терминов из {len(all_terms)} всего",
-        data={
-            "total": len(all_terms),
+@app.get("/health", tags=["Health"])
+async def health_check():
+    global _last_ts
+    second = int(time.time())
+    if second != _last_ts[0]:
+        _last_ts = (second, datetime.fromtimestamp(second).isoformat(timespec="seconds"))
+    return {"status": "healthy", "timestamp": _last_ts[1]}
+
+
+# Ответы на чтение собираются из уже проверенных внутренних данных,
+# поэтому отдаются напрямую через ORJSONResponse без повторной валидации.
+READ_RESPONSES = {200: {"model": GlossaryResponse}}
+
+
+@app.get("/api/glossary", responses=READ_RESPONSES, tags=["Glossary"])
+async def get_all_terms(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: GlossaryDatabase = Depends(get_db)
+):
+    total = db.count()
+    paginated_terms = db.iter_page(skip, limit)
+
+    return ORJSONResponse({
+        "success": True,
+        "message": f"Получено {len(paginated_terms)} терминов из {total} всего",
+        "data": {
+            "total": total,
             "skip": skip,
             "limit": limit,
             "items": paginated_terms
         }
-    )
+    })
 
 
-@app.get("/api/glossary/{term_id}", response_model=GlossaryResponse, tags=["Glossary"])
-async def get_term(term_id: int):
+@app.get("/api/glossary/{term_id}", responses=READ_RESPONSES, tags=["Glossary"])
+async def get_term(term_id: int, db: GlossaryDatabase = Depends(get_db)):
     term = db.get_by_id(term_id)
     if not term:
         raise HTTPException(
@@ -205,39 +563,54 @@ async def get_term(term_id: int):
             detail=f"Термин с ID {term_id} не найден"
         )
 
-    return GlossaryResponse(
-        success=True,
-        message="Термин найден",
-        data=term
-    )
+    return ORJSONResponse({
+        "success": True,
+        "message": "Термин найден",
+        "data": term
+    })
 
 
-@app.get("/api/glossary/search/{keyword}", response_model=GlossaryResponse, tags=["Glossary"])
-async def search_terms(keyword: str = Query(..., min_length=1, max_length=100)):
+@app.get("/api/glossary/search/{keyword}", responses=READ_RESPONSES, tags=["Glossary"])
+async def search_terms(
+    keyword: str = PathParam(..., min_length=1, max_length=100),
+    db: GlossaryDatabase = Depends(get_db)
+):
 
     results = db.search(keyword)
 
-    return GlossaryResponse(
-        success=True,
-        message=f"Найдено {len(results)} терминов",
-        data=results
-    )
+    return ORJSONResponse({
+        "success": True,
+        "message": f"Найдено {len(results)} терминов",
+        "data": results
+    })
 
 
 @app.post("/api/glossary", response_model=GlossaryResponse, status_code=201, tags=["Glossary"])
-async def create_term(term: GlossaryTermCreate):
+async def create_term(term: GlossaryTermCreate, db: GlossaryDatabase = Depends(get_db)):
 
     new_term = db.create(term)
 
     return GlossaryResponse(
         success=True,
         message="Новый термин успешно добавлен",
-        data=new_term
+        data=asdict(new_term)
+    )
+
+
+@app.post("/api/glossary/bulk", response_model=GlossaryResponse, status_code=201, tags=["Glossary"])
+async def create_terms_bulk(terms: list[GlossaryTermCreate], db: GlossaryDatabase = Depends(get_db)):
+
+    new_terms = db.write_batch(terms)
+
+    return GlossaryResponse(
+        success=True,
+        message=f"Добавлено {len(new_terms)} терминов",
+        data=[asdict(new_term) for new_term in new_terms]
     )
 
 
 @app.put("/api/glossary/{term_id}", response_model=GlossaryResponse, tags=["Glossary"])
-async def update_term(term_id: int, term_update: GlossaryTermUpdate):
+async def update_term(term_id: int, term_update: GlossaryTermUpdate, db: GlossaryDatabase = Depends(get_db)):
 
     updated_term = db.update(term_id, term_update)
     if not updated_term:
@@ -249,12 +622,12 @@ async def update_term(term_id: int, term_update: GlossaryTermUpdate):
     return GlossaryResponse(
         success=True,
         message="Термин успешно обновлен",
-        data=updated_term
+        data=asdict(updated_term)
     )
 
 
 @app.delete("/api/glossary/{term_id}", response_model=GlossaryResponse, tags=["Glossary"])
-async def delete_term(term_id: int):
+async def delete_term(term_id: int, db: GlossaryDatabase = Depends(get_db)):
     success = db.delete(term_id)
     if not success:
         raise HTTPException(
@@ -269,24 +642,13 @@ async def delete_term(term_id: int):
     )
 
 
-@app.get("/api/statistics", response_model=GlossaryResponse, tags=["Info"])
-async def get_statistics():
-    all_terms = db.get_all()
-    categories = {}
-
-    for term in all_terms:
-        category = term.get("category", "Unknown")
-        categories[category] = categories.get(category, 0) + 1
-
-    return GlossaryResponse(
-        success=True,
-        message="Статистика глоссария",
-        data={
-            "total_terms": len(all_terms),
-            "categories": categories,
-            "categories_count": len(categories)
-        }
-    )
+@app.get("/api/statistics", responses=READ_RESPONSES, tags=["Info"])
+async def get_statistics(db: GlossaryDatabase = Depends(get_db)):
+    return ORJSONResponse({
+        "success": True,
+        "message": "Статистика глоссария",
+        "data": db.get_statistics()
+    })
 
 
 if __name__ == "__main__":
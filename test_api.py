@@ -1,20 +1,24 @@
 import pytest
 from fastapi.testclient import TestClient
 from pathlib import Path
-import json
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+import orjson
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.main import app, GlossaryDatabase
+from app.main import (
+    app, DATA_FILE, GlossaryDatabase, GlossaryTermCreate, GlossaryTermUpdate, TermRow, get_db
+)
 
 client = TestClient(app)
 
 
-@pytest.fixture
-def test_db(tmp_path):
-    test_file = tmp_path / "test_glossary.json"
-    test_file.write_text(json.dumps({
+@pytest.fixture(scope="module")
+def test_db():
+    return GlossaryDatabase(None, data={
         "glossary": [
             {
                 "id": 1,
@@ -28,8 +32,14 @@ def test_db(tmp_path):
                 "updated_at": "2024-01-01T00:00:00"
             }
         ]
-    }))
-    return GlossaryDatabase(test_file)
+    })
+
+
+@pytest.fixture(scope="module", autouse=True)
+def override_db(test_db):
+    app.dependency_overrides[get_db] = lambda: test_db
+    yield
+    app.dependency_overrides.clear()
 
 
 class TestHealthCheck:
@@ -38,6 +48,13 @@ class TestHealthCheck:
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
 
+    def test_timestamp_follows_clock_second(self, monkeypatch):
+        seconds = iter([1000.2, 1000.9, 1001.1])
+        monkeypatch.setattr("app.main.time", SimpleNamespace(time=lambda: next(seconds)))
+        stamps = [client.get("/health").json()["timestamp"] for _ in range(3)]
+        assert stamps[0] == stamps[1] == datetime.fromtimestamp(1000).isoformat()
+        assert stamps[2] == datetime.fromtimestamp(1001).isoformat()
+
 
 class TestRootEndpoint:
     def test_root(self):
@@ -94,12 +111,39 @@ class TestCreateTerm:
         assert response.status_code == 422
 
 
+class TestBulkCreate:
+    def test_bulk_create(self, test_db):
+        terms = [
+            {"title": f"Bulk Term {i}", "definition": "Definition of a term created in bulk"}
+            for i in range(3)
+        ]
+        response = client.post("/api/glossary/bulk", json=terms)
+        assert response.status_code == 201
+        created = response.json()["data"]
+        assert [term["title"] for term in created] == [term["title"] for term in terms]
+        assert all(test_db.get_by_id(term["id"]) for term in created)
+
+    def test_bulk_create_invalid_term(self):
+        response = client.post("/api/glossary/bulk", json=[{"title": "", "definition": "Short"}])
+        assert response.status_code == 422
+
+
 class TestSearchTerms:
     def test_search_existing_term(self):
         response = client.get("/api/glossary/search/DApp")
         assert response.status_code == 200
         assert response.json()["success"] == True
 
+    def test_search_matches_substring(self):
+        response = client.get("/api/glossary/search/test term")
+        assert response.status_code == 200
+        assert [term["id"] for term in response.json()["data"]] == [1]
+
+    def test_search_no_match(self):
+        response = client.get("/api/glossary/search/nonexistentword")
+        assert response.status_code == 200
+        assert response.json()["data"] == []
+
     def test_search_empty_keyword(self):
         response = client.get("/api/glossary/search/")
         assert response.status_code == 422
@@ -132,6 +176,152 @@ class TestDeleteTerm:
         assert response.json()["success"] == False
 
 
+class TestCORS:
+    @pytest.fixture
+    def cors_header_parses(self, monkeypatch):
+        import starlette.middleware.cors as cors
+        parses = []
+        real_headers = cors.Headers
+
+        def spy(*args, **kwargs):
+            parses.append(kwargs)
+            return real_headers(*args, **kwargs)
+
+        monkeypatch.setattr(cors, "Headers", spy)
+        return parses
+
+    def test_same_origin_request_skips_cors_middleware(self, cors_header_parses):
+        response = client.get("/")
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+        assert cors_header_parses == []
+
+    def test_cross_origin_request_goes_through_cors_middleware(self, cors_header_parses):
+        client.get("/", headers={"Origin": "http://example.com"})
+        assert len(cors_header_parses) == 1
+
+    def test_cross_origin_request(self):
+        response = client.get("/", headers={"Origin": "http://example.com"})
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "*"
+
+    def test_preflight_is_cached(self):
+        response = client.options("/api/glossary", headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "GET"
+        })
+        assert response.status_code == 200
+        assert response.headers["access-control-max-age"] == "86400"
+
+
+@pytest.fixture(scope="module")
+def shipped_db():
+    return GlossaryDatabase(None, data=orjson.loads(DATA_FILE.read_bytes()))
+
+
+class TestSearchMatching:
+    @pytest.mark.parametrize("keyword", ["блокчейн", "смарт-контракт", "dapp", "xyzq", " (", "(", ", "])
+    def test_matches_naive_scan(self, shipped_db, keyword):
+        folded = keyword.casefold()
+        expected = {term_id for term_id, blob in shipped_db._blobs.items() if folded in blob}
+        assert {term.id for term in shipped_db.search(keyword)} == expected
+
+
+class TestTermRow:
+    def test_partial_entry_gets_defaults(self):
+        term = TermRow.from_dict({
+            "id": 7,
+            "title": "Partial",
+            "definition": "Entry without optional fields",
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00",
+            "legacy_field": "ignored"
+        })
+        assert term.category == "General"
+        assert term.examples == [] and term.related_terms == [] and term.source == ""
+
+    def test_missing_required_field(self):
+        with pytest.raises(ValueError, match="definition"):
+            TermRow.from_dict({
+                "id": 7,
+                "title": "Broken",
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:00"
+            })
+
+
+def new_term(title):
+    return GlossaryTermCreate(title=title, definition=f"Definition of the {title} term")
+
+
+def titles(db):
+    return [term.title for term in db.get_all()]
+
+
+class TestJournal:
+    def test_replay_without_close(self, tmp_path):
+        data_file = tmp_path / "glossary.json"
+        db = GlossaryDatabase(data_file)
+        alpha = db.create(new_term("Alpha"))
+        beta = db.create(new_term("Beta"))
+        db.create(new_term("Gamma"))
+        db.update(alpha.id, GlossaryTermUpdate(category="Updated"))
+        db.delete(beta.id)
+
+        reopened = GlossaryDatabase(data_file)
+        assert reopened.get_all() == db.get_all()
+        assert reopened.get_by_id(alpha.id).category == "Updated"
+        assert reopened.get_by_id(beta.id) is None
+
+    def test_compaction_after_threshold(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.main.WAL_COMPACT_THRESHOLD", 3)
+        data_file = tmp_path / "glossary.json"
+        db = GlossaryDatabase(data_file)
+        for title in ("Alpha", "Beta", "Gamma"):
+            db.create(new_term(title))
+
+        assert data_file.exists()
+        assert data_file.with_suffix(".jsonl").stat().st_size == 0
+        reopened = GlossaryDatabase(data_file)
+        assert titles(reopened) == ["Alpha", "Beta", "Gamma"]
+
+    def test_broken_trailing_line(self, tmp_path):
+        data_file = tmp_path / "glossary.json"
+        db = GlossaryDatabase(data_file)
+        db.create(new_term("Alpha"))
+        with open(data_file.with_suffix(".jsonl"), "ab") as f:
+            f.write(b'{"op":"create","term":{"id":99')
+
+        db = GlossaryDatabase(data_file)
+        db.create(new_term("Beta"))
+
+        reopened = GlossaryDatabase(data_file)
+        assert titles(reopened) == ["Alpha", "Beta"]
+
+    def test_empty_snapshot_is_an_error(self, tmp_path):
+        data_file = tmp_path / "glossary.json"
+        data_file.write_bytes(b"")
+        with pytest.raises(ValueError):
+            GlossaryDatabase(data_file)
+
+    def test_debounced_flush(self, tmp_path):
+        data_file = tmp_path / "glossary.json"
+        db = GlossaryDatabase(data_file)
+
+        async def burst():
+            db.create(new_term("Alpha"))
+            first_handle = db._flush_handle
+            db.create(new_term("Beta"))
+            assert first_handle.cancelled()
+            assert db._dirty
+            await asyncio.sleep(0.3)
+            assert not db._dirty
+            assert db._flush_handle is None
+
+        asyncio.run(burst())
+        assert titles(GlossaryDatabase(data_file)) == ["Alpha", "Beta"]
+
+
 class TestStatistics:
     def test_get_statistics(self):
         response = client.get("/api/statistics")